@@ -1,18 +1,22 @@
 import csv
 import importlib
+import io
 import json
 import os
 import re
 import sys
 import warnings
 
-from contextlib import ExitStack
-from itertools import chain, repeat, islice
+from functools import lru_cache
+from itertools import chain
+from operator import methodcaller
 from pathlib import Path
 from string import ascii_letters, digits, punctuation
 from textwrap import wrap
 from typing import (
     Any,
+    Callable,
+    Dict,
     Generator,
     Iterable,
     List,
@@ -20,24 +24,11 @@ from typing import (
     Optional,
     Set,
     TextIO,
+    Tuple,
     Union,
 )
 
-from requests.structures import CaseInsensitiveDict
-
-try:  # pragma: no cover
-    # This import works for smart_open>=1.8.1
-    from smart_open import open
-except ImportError as error:  # pragma: no cover
-    try:
-        # This import works for smart_open<1.8.1
-        from smart_open import smart_open as open
-    except ImportError as error:
-        pass
-from tabulate import tabulate
-from terminaltables import SingleTable
-
-from .util import maybe_render_markdown
+from .util import CaseInsensitiveDict, maybe_render_markdown, open_path
 
 __all__: List[str] = ['ReadStructure', 'Sample', 'SampleSheet']
 
@@ -62,6 +53,14 @@ MIN_WIDTH: int = 10
 #     sequencing-sheet-format-specifications-technical-note-970-2017-004.pdf
 VALID_ASCII: Set[str] = set(ascii_letters + digits + punctuation + ' \n\r')
 
+# Characters, besides the delimiter, which force the csv module to quote.
+_QUOTE_CHARS: Set[str] = set('"\r\n')
+
+# Deletes all valid characters so only invalid characters survive translation.
+_INVALID_ASCII_TABLE: Dict[int, Any] = str.maketrans(
+    '', '', ''.join(VALID_ASCII)
+)
+
 
 class ReadStructure(object):
     """An object describing the order, number, and type of bases in a read.
@@ -107,136 +106,168 @@ class ReadStructure(object):
 
     """
 
-    _token_pattern = re.compile(r'(\d+[BMST])')
+    __slots__ = (
+        '_structure',
+        '_tokens',
+        '_tokens_by_operator',
+        '_cycles_by_operator',
+        '_total_cycles',
+    )
 
-    # operator can repeat one or more times along the entire string.
-    _valid_pattern = re.compile(r'^{}+$'.format(_token_pattern.pattern))
-
-    _index_pattern = re.compile(r'(\d+B)')
-    _umi_pattern = re.compile(r'(\d+M)')
-    _skip_pattern = re.compile(r'(\d+S)')
-    _template_pattern = re.compile(r'(\d+T)')
-    _nonnumber_pattern = re.compile(r'\D')
+    _token_pattern = re.compile(r'(\d+)([BMST])')
 
     def __init__(self, structure: str) -> None:
-        if not bool(self._valid_pattern.match(structure)):
+        # Tokenize the structure in one scan, all properties derive from it.
+        # The groups of each match give the cycle count and operator.
+        self._tokens: List[str] = []
+        self._tokens_by_operator: Dict[str, List[str]] = {
+            operator: [] for operator in 'BMST'
+        }
+        self._cycles_by_operator: Dict[str, int] = dict.fromkeys('BMST', 0)
+        for match in self._token_pattern.finditer(structure):
+            cycles, operator = match.groups()
+            token = match.group()
+            self._tokens.append(token)
+            self._tokens_by_operator[operator].append(token)
+            self._cycles_by_operator[operator] += int(cycles)
+
+        # The structure is valid only if its tokens cover the entire string.
+        if not self._tokens or ''.join(self._tokens) != structure:
             raise ValueError(f'Not a valid read structure: "{structure}"')
-        self.structure = structure
+        # Interned so string equality short-circuits on identity.
+        self._structure = sys.intern(structure)
+        self._total_cycles: int = sum(self._cycles_by_operator.values())
 
-    def _sum_cycles_from_tokens(self, tokens: List[str]) -> int:
-        """Sum the total number of cycles over a list of tokens."""
-        return sum((int(self._nonnumber_pattern.sub('', t)) for t in tokens))
+    @property
+    def structure(self) -> str:
+        """Read structure string representation.
+
+        Instances are shared between samples so this is read-only.
+
+        """
+        return self._structure
 
     @property
     def is_indexed(self) -> bool:
         """Return if this read structure has sample indexes."""
-        return len(self._index_pattern.findall(self.structure)) > 0
+        return len(self._tokens_by_operator['B']) > 0
 
     @property
     def is_single_indexed(self) -> bool:
         """Return if this read structure is single indexed."""
-        return len(self._index_pattern.findall(self.structure)) == 1
+        return len(self._tokens_by_operator['B']) == 1
 
     @property
     def is_dual_indexed(self) -> bool:
         """Return if this read structure is dual indexed."""
-        return len(self._index_pattern.findall(self.structure)) == 2
+        return len(self._tokens_by_operator['B']) == 2
 
     @property
     def is_single_end(self) -> bool:
         """Return if this read structure is single-end."""
-        return len(self._template_pattern.findall(self.structure)) == 1
+        return len(self._tokens_by_operator['T']) == 1
 
     @property
     def is_paired_end(self) -> bool:
         """Return if this read structure is paired-end."""
-        return len(self._template_pattern.findall(self.structure)) == 2
+        return len(self._tokens_by_operator['T']) == 2
 
     @property
     def has_indexes(self) -> bool:
         """Return if this read structure has any index operators."""
-        return len(self._index_pattern.findall(self.structure)) > 0
+        return len(self._tokens_by_operator['B']) > 0
 
     @property
     def has_skips(self) -> bool:
         """Return if this read structure has any skip operators."""
-        return len(self._skip_pattern.findall(self.structure)) > 0
+        return len(self._tokens_by_operator['S']) > 0
 
     @property
     def has_umi(self) -> bool:
         """Return if this read structure has any UMI operators."""
-        return len(self._umi_pattern.findall(self.structure)) > 0
+        return len(self._tokens_by_operator['M']) > 0
 
     @property
     def index_cycles(self) -> int:
         """The number of cycles dedicated to indexes."""
-        return self._sum_cycles_from_tokens(self.index_tokens)
+        return self._cycles_by_operator['B']
 
     @property
     def template_cycles(self) -> int:
         """The number of cycles dedicated to template."""
-        return sum((int(re.sub(r'\D', '', op)) for op in self.template_tokens))
+        return self._cycles_by_operator['T']
 
     @property
     def skip_cycles(self) -> int:
         """The number of cycles dedicated to skips."""
-        return sum((int(re.sub(r'\D', '', op)) for op in self.skip_tokens))
+        return self._cycles_by_operator['S']
 
     @property
     def umi_cycles(self) -> int:
         """The number of cycles dedicated to UMI."""
-        return sum((int(re.sub(r'\D', '', op)) for op in self.umi_tokens))
+        return self._cycles_by_operator['M']
 
     @property
     def total_cycles(self) -> int:
         """The number of total number of cycles in the structure."""
-        return sum((int(re.sub(r'\D', '', op)) for op in self.tokens))
+        return self._total_cycles
 
     @property
     def tokens(self) -> List[str]:
         """Return a list of all tokens in the read structure."""
-        return self._token_pattern.findall(self.structure)
+        return list(self._tokens)
 
     @property
     def index_tokens(self) -> List[str]:
         """Return a list of all index tokens in the read structure."""
-        return self._index_pattern.findall(self.structure)
+        return list(self._tokens_by_operator['B'])
 
     @property
     def skip_tokens(self) -> List[str]:
         """Return a list of all skip tokens in the read structure."""
-        return self._skip_pattern.findall(self.structure)
+        return list(self._tokens_by_operator['S'])
 
     @property
     def template_tokens(self) -> List[str]:
         """Return a list of all template tokens in the read structure."""
-        return self._template_pattern.findall(self.structure)
+        return list(self._tokens_by_operator['T'])
 
     @property
     def umi_tokens(self) -> List[str]:
         """Return a list of all UMI tokens in the read structure."""
-        return self._umi_pattern.findall(self.structure)
+        return list(self._tokens_by_operator['M'])
 
     def copy(self) -> 'ReadStructure':
-        """Return a deep copy of this read structure."""
-        return ReadStructure(self.structure)
+        """Return this read structure, which is immutable and safe to share."""
+        return self
 
     def __eq__(self, other: object) -> bool:
         """Read structures are equal if their string repr are equal."""
         if not isinstance(other, ReadStructure):
             raise NotImplementedError
-        return self.structure == other.structure
+        return self._structure == other._structure
 
     def __repr__(self) -> str:
         """Return an executeable ``__repr__()``."""
         return (
             f'{self.__class__.__qualname__}('
-            f'structure=\'{self.structure}\')'
+            f'structure=\'{self._structure}\')'
         )
 
     def __str__(self) -> str:
         """Cast this object to string."""
-        return self.structure
+        return self._structure
+
+
+@lru_cache(maxsize=128)
+def _make_read_structure(structure: str) -> ReadStructure:
+    """Return a shared :class:`ReadStructure` for a structure string.
+
+    Samples on a sample sheet almost always share one read structure, so the
+    instance is built once and reused since it is never mutated after init.
+
+    """
+    return ReadStructure(structure)
 
 
 class Sample(CaseInsensitiveDict):
@@ -271,32 +302,110 @@ class Sample(CaseInsensitiveDict):
 
     """
 
-    _valid_index_key_pattern = re.compile(r'index\d?')
+    # Keep ``__dict__`` so arbitrary attributes can still be set, it is only
+    # allocated for the samples which do so.
+    __slots__ = ('_identity_key', '_json', 'sample_sheet', '__dict__')
+
+    _read_structure_keys = frozenset(
+        {
+            'Read_Structure',
+            'ReadStructure',
+            'READ_STRUCTURE',
+            'read_structure',
+            'readstructure',
+        }
+    )
+    _valid_index_bases = frozenset('ACGTN')
     # https://kb.10xgenomics.com/hc/en-us/articles/218168503-What-oligos-are-in-my-sample-index-
-    _valid_index_value_pattern = re.compile(r'^[ACGTN]*$|^SI-[ACGTNS]{2}-[A-H]\d+$')
+    _valid_10x_index_pattern = re.compile(r'SI-[ACGTNS]{2}-[A-H]\d+')
 
     def __init__(
         self, data: Optional[Mapping] = None, **kwargs: Mapping
     ) -> None:
+        # Cached attributes which define equality, see ``_identity()``, and
+        # the cached JSON serializable mapping, see ``to_json()``.
+        self._identity_key: Optional[Tuple] = None
+        self._json: Optional[Dict[str, str]] = None
+
         super().__init__()
         data = {**data, **kwargs} if data is not None else kwargs
 
-        self._store: Mapping
         self.sample_sheet: Optional[SampleSheet] = None
 
         for key, value in data.items():
+            is_read_structure_key, is_index_key = _classify_sample_key(key)
+
             # Promote a ``Read_Structure`` key to :class:`ReadStructure`.
-            # Support case insensitivity and any amount of underscores.
-            if key.lower().replace('_', '') == 'readstructure':
-                value = ReadStructure(str(value))
+            if is_read_structure_key:
+                value = _make_read_structure(str(value))
 
             # Check to make sure the index is valid if it is supplied.
-            if self._valid_index_key_pattern.match(key) and not bool(
-                self._valid_index_value_pattern.match(str(value))
-            ):
+            if is_index_key and not self._is_valid_index(str(value)):
                 raise ValueError(f'Not a valid index: {value}')
 
             self[key] = value
+
+        self._validate_read_structure_indexes()
+
+    @classmethod
+    def _row_factory(
+        cls, header: List[str]
+    ) -> Callable[[List[str]], 'Sample']:
+        """Return a function which builds samples from rows under a header.
+
+        The columns that need promotion or validation are found once from the
+        header so that each row only does work for those columns. This is
+        equivalent to ``Sample(dict(zip(header, row)))``.
+
+        """
+        keys = [key.lower() for key in header]
+        original_keys = list(zip(keys, header))
+        kinds = [_classify_sample_key(key) for key in header]
+        read_structure_columns = [
+            i
+            for i, (is_read_structure, _) in enumerate(kinds)
+            if is_read_structure
+        ]
+        index_columns = [
+            i for i, (_, is_index) in enumerate(kinds) if is_index
+        ]
+
+        def from_row(row: List[str]) -> 'Sample':
+            for i in index_columns:
+                if i < len(row) and not cls._is_valid_index(row[i]):
+                    raise ValueError(f'Not a valid index: {row[i]}')
+
+            sample = cls.__new__(cls)
+            sample._identity_key = None
+            sample._json = None
+            sample._store = dict(zip(keys, row))
+            # Rows shorter than the header only hold their leading keys.
+            sample._keys = dict(original_keys[: len(row)])
+            sample.sample_sheet = None
+
+            for i in read_structure_columns:
+                if i < len(row):
+                    sample._store[keys[i]] = _make_read_structure(row[i])
+
+            sample._validate_read_structure_indexes()
+            return sample
+
+        return from_row
+
+    @classmethod
+    def _is_read_structure_key(cls, key: str) -> bool:
+        """Return if a key names a read structure.
+
+        Support case insensitivity and any amount of underscores. The common
+        spellings are checked first to avoid normalizing the key.
+
+        """
+        return key in cls._read_structure_keys or (
+            len(key) >= 13 and key.lower().replace('_', '') == 'readstructure'
+        )
+
+    def _validate_read_structure_indexes(self) -> None:
+        """Ensure the indexes required by the read structure are defined."""
         if (
             self.Read_Structure is not None
             and self.Read_Structure.is_single_indexed
@@ -318,11 +427,42 @@ class Sample(CaseInsensitiveDict):
                 f'also: {self}'
             )
 
+    @classmethod
+    def _is_valid_index(cls, value: str) -> bool:
+        """Return if a value is a nucleotide or 10x Genomics sample index."""
+        if cls._valid_index_bases.issuperset(value):
+            return True
+        return (
+            value.startswith('SI-')
+            and cls._valid_10x_index_pattern.fullmatch(value) is not None
+        )
+
+    def _identity(self) -> Tuple:
+        """Return the ``Sample_ID``, ``Library_ID``, and ``Lane`` attributes.
+
+        The tuple is cached until the next time a key on this sample is set or
+        deleted, which makes comparing and indexing samples cheap.
+
+        """
+        if self._identity_key is None:
+            get = self.get
+            self._identity_key = (
+                get('Sample_ID'),
+                get('Library_ID'),
+                get('Lane'),
+            )
+        return self._identity_key
+
     def to_json(self) -> Mapping:
         """Return the properties of this :class:`Sample` as JSON serializable.
 
+        The mapping is cached until the next time a key on this sample is set
+        or deleted, a copy is returned so the cache cannot be modified.
+
         """
-        return {str(x): str(y) for x, y in self.items()}
+        if self._json is None:
+            self._json = {str(x): str(y) for x, y in self.items()}
+        return dict(self._json)
 
     def __eq__(self, other: object) -> bool:
         """Samples are equal if the following attributes are equal:
@@ -334,26 +474,45 @@ class Sample(CaseInsensitiveDict):
         """
         if not isinstance(other, Sample):
             raise NotImplementedError
-        is_equal: bool = (
-            self.Sample_ID == other.Sample_ID
-            and self.Library_ID == other.Library_ID
-            and self.Lane == other.Lane
-        )
+        is_equal: bool = self._identity() == other._identity()
         return is_equal
 
     def __getattr__(self, attr: Any) -> Optional[Any]:
         """Return ``None`` if an attribute is undefined."""
-        return super().get(attr)
+        return self.get(attr)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a key-value pair and invalidate the cached identity."""
+        super().__setitem__(key, value)
+        self._identity_key = self._json = None
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a key-value pair and invalidate the cached identity."""
+        super().__delitem__(key)
+        self._identity_key = self._json = None
 
     def __repr__(self) -> str:
         """Return an executeable ``__repr__()``."""
-        args = {key: getattr(self, key) for key in RECOMMENDED_KEYS}
+        args = {key: self.get(key) for key in RECOMMENDED_KEYS}
         args_str = args.__repr__()
         return f'{self.__class__.__qualname__}({args_str})'
 
     def __str__(self) -> str:
         """Cast this object to string."""
-        return str(self.Sample_ID) if self.Sample_ID is not None else ''
+        sample_id = self.get('Sample_ID')
+        return str(sample_id) if sample_id is not None else ''
+
+
+@lru_cache(maxsize=256)
+def _classify_sample_key(key: str) -> Tuple[bool, bool]:
+    """Return if a sample key names a read structure and if it names an index.
+
+    Index keys are ``index``, ``index2``, etc. so only the prefix is tested.
+    Sheets reuse the same few column names for every sample so the answer is
+    cached by key.
+
+    """
+    return Sample._is_read_structure_key(key), key.startswith('index')
 
 
 class Section(CaseInsensitiveDict):
@@ -364,7 +523,6 @@ class Section(CaseInsensitiveDict):
     def __init__(
         self, data: Optional[Mapping] = None, **kwargs: Mapping
     ) -> None:
-        self._store: Mapping
         super().__init__(data=data, **kwargs)
 
     def __getattr__(self, attr: Any) -> Optional[Any]:
@@ -372,6 +530,33 @@ class Section(CaseInsensitiveDict):
         return super().get(attr)
 
 
+def _format_row(fields: List[str], delimiter: str = ',') -> str:
+    """Format one delimited line exactly as :func:`csv.writer` would.
+
+    Fields which need quoting are rare, so only those lines fall back to the
+    :mod:`csv` module and all others are joined directly.
+
+    """
+    line = delimiter.join(fields)
+    needs_quoting = line.count(delimiter) >= len(fields)
+    if not needs_quoting and _QUOTE_CHARS.isdisjoint(line):
+        return line + '\r\n'
+    buffer = io.StringIO()
+    csv.writer(buffer, delimiter=delimiter).writerow(fields)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1024)
+def _wrap(text: str, width: int) -> str:
+    """Wrap ``text`` to ``width`` columns and join the lines with newlines.
+
+    Many samples share the same boilerplate description so the wrapped text
+    is cached by ``(text, width)``.
+
+    """
+    return '\n'.join(wrap(text, width))
+
+
 class SampleSheet(object):
     """A representation of an Illumina sample sheet.
 
@@ -407,6 +592,12 @@ class SampleSheet(object):
         self._samples: List[Sample] = []
         self._sections: List[str] = []
 
+        # Hash indexes of the samples, used to validate new samples. Samples
+        # stay mutable and ``samples`` is the live list, so the indexes are
+        # rebuilt from the current samples before every call that adds any.
+        self._sample_keys: Dict[Tuple, Sample] = {}
+        self._index_keys: Dict[Tuple, Sample] = {}
+
         self.Reads: List[int] = []
         self.Read_Structure: Optional[ReadStructure] = None
         self.samples_have_index: Optional[bool] = None
@@ -418,7 +609,7 @@ class SampleSheet(object):
 
         if self.path is not None:
           if isinstance(self.path, (str, Path)):
-            with open(self.path, 'r') as f:
+            with open_path(self.path) as f:
               self._parse(f)
           else:
             self._parse(self.path)
@@ -426,6 +617,9 @@ class SampleSheet(object):
     def add_section(self, section_name: str) -> None:
         """Add a section to the :class:`SampleSheet`."""
         section_name = self._whitespace_re.sub('_', section_name)
+        # Register each section once so it is only ever written once.
+        if section_name in self._sections:
+            return
         self._sections.append(section_name)
         setattr(self, section_name, Section())
 
@@ -437,11 +631,12 @@ class SampleSheet(object):
         the order of keys upon those samples.
 
         """
-        all_keys: List[str] = []
-        for key in chain.from_iterable([sample.keys() for sample in self]):
-            if key not in all_keys:
-                all_keys.append(key)
-        return all_keys
+        # A dictionary is used as an insertion ordered set of the keys. Each
+        # sample iterates its own keys so no per-sample views are built.
+        all_keys: Dict[str, None] = dict.fromkeys(
+            chain.from_iterable(self._samples)
+        )
+        return list(all_keys)
 
     @property
     def experimental_design(self) -> Any:
@@ -455,11 +650,16 @@ class SampleSheet(object):
             Markdown, str: A visual table of IDs and names for all samples.
 
         """
+        from tabulate import tabulate
+
         if not self.samples:
             raise ValueError('No samples in sample sheet')
 
+        # Read with ``Sample.get()`` which skips the failed attribute lookup
+        # behind every ``getattr()`` call on a sample.
+        getters = (sample.get for sample in self.samples)
         markdown = tabulate(
-            [[getattr(s, h, '') for h in DESIGN_HEADER] for s in self.samples],
+            [[get(key) for key in DESIGN_HEADER] for get in getters],
             headers=DESIGN_HEADER,
             tablefmt='pipe',
         )
@@ -483,27 +683,61 @@ class SampleSheet(object):
 
     def _parse(self, handle: TextIO) -> None:
         section_name: str = ''
-        sample_header: Optional[List[str]] = None
+        sample_header: List[str] = []
+        sample_from_row: Callable[[List[str]], Sample]
+        parse_line: Callable[[List[str]], None]
+
+        # [Reads] - vertical list of integers.
+        def parse_reads(line: List[str]) -> None:
+            self.Reads.append(int(line[0]))
+
+        # [Data] - delimited data with the first line a header.
+        def parse_data_header(line: List[str]) -> None:
+            nonlocal sample_header, sample_from_row, parse_line
+            if any(key == '' for key in line):
+                raise ValueError(
+                    f'Header for [Data] section is not allowed to '
+                    f'have empty fields: {line}'
+                )
+            sample_header = line
+            sample_from_row = Sample._row_factory(sample_header)
+            self._reindex_samples()
+            # All following lines in the [Data] section are samples.
+            parse_line = handlers['Data'] = parse_data_row
+
+        def parse_data_row(line: List[str]) -> None:
+            self._add_sample(sample_from_row(line))
+
+        # [<Other>] - keys in first column and values in second column.
+        def parse_other(line: List[str]) -> None:
+            if len(line) >= 2:
+                section: Section = getattr(self, section_name)
+                section[line[0]] = line[1]
 
-        lines = list(csv.reader(handle, skipinitialspace=True))
+        # The line handler is only looked up when a new section is entered.
+        handlers: Dict[str, Callable[[List[str]], None]] = {
+            'Reads': parse_reads,
+            'Data': parse_data_header,
+        }
+        parse_line = parse_other
 
-        for i, line in enumerate(lines):
+        lines = csv.reader(handle, skipinitialspace=True)
+
+        for i, line in enumerate(lines, start=1):
             # Skip to next line if this line is empty to support formats of
             # sample sheets with multiple newlines as section seperators.
             #
             #   https://github.com/clintval/sample-sheet/issues/46
             #
-            if not ''.join(line).strip():
+            joined = ''.join(line)
+            if not joined or joined.isspace():
                 continue
 
             # Raise exception if we encounter invalid characters.
-            if any(
-                character not in VALID_ASCII
-                for character in set(''.join(line))
-            ):
+            if joined.translate(_INVALID_ASCII_TABLE):
                 raise ValueError(
                     f'Sample sheet contains invalid characters on line '
-                    f'{i + 1}: {"".join(line)}'
+                    f'{i}: {joined}'
                 )
 
             header_match = self._section_header_re.match(line[0])
@@ -516,31 +750,10 @@ class SampleSheet(object):
                     and section_name not in REQUIRED_SECTIONS
                 ):
                     self.add_section(section_name)
+                parse_line = handlers.get(section_name, parse_other)
                 continue
 
-            # [Reads] - vertical list of integers.
-            if section_name == 'Reads':
-                self.Reads.append(int(line[0]))
-                continue
-
-            # [Data] - delimited data with the first line a header.
-            elif section_name == 'Data':
-                if sample_header is not None:
-                    self.add_sample(Sample(dict(zip(sample_header, line))))
-                elif any(key == '' for key in line):
-                    raise ValueError(
-                        f'Header for [Data] section is not allowed to '
-                        f'have empty fields: {line}'
-                    )
-                else:
-                    sample_header = line
-                continue
-
-            # [<Other>] - keys in first column and values in second column.
-            elif len(line) >= 2:
-                key, value = (line[0], line[1])
-                section: Section = getattr(self, section_name)
-                section[key] = value
+            parse_line(line)
 
     def add_sample(self, sample: Sample) -> None:
         """Add a :class:`Sample` to this :class:`SampleSheet`.
@@ -582,115 +795,158 @@ class SampleSheet(object):
             SampleSheet('tests/resources/single-end-colliding-sample-ids.csv')
 
         """
+        self._reindex_samples()
+        self._add_sample(sample)
+
+    def _add_sample(self, sample: Sample) -> None:
+        """Validate and add a sample against the current hash indexes."""
+        # Every attribute lookup on a sample is a case-insensitive dictionary
+        # lookup, so fetch the attributes used in validation only once. Use
+        # ``get()`` to skip the failed attribute lookup which precedes every
+        # ``Sample.__getattr__()`` call.
+        get = sample.get
+        sample_id = get('Sample_ID')
+        index, index2 = get('index'), get('index2')
+        read_structure = get('Read_Structure')
+
         # Do not allow samples without Sample_ID defined.
-        if sample.Sample_ID is None:
+        if sample_id is None:
             raise ValueError('Sample must have "Sample_ID" defined.')
 
-        # Set whether the samples will have ``index`` or ``index2``.
-        if len(self.samples) == 0:
-            self.samples_have_index = sample.index is not None
-            self.samples_have_index2 = sample.index2 is not None
+        # The first sample added to the sample sheet sets whether the samples
+        # will have ``index`` or ``index2``. Every later sample skips this.
+        if not self._samples:
+            self.samples_have_index = index is not None
+            self.samples_have_index2 = index2 is not None
 
-        if (
-            len(self.samples) == 0
-            and sample.Read_Structure is not None
-            and self.Read_Structure is None
-        ):
-            # If this is the first sample added to the sample sheet then
-            # assume the ``SampleSheet.Read_Structure`` inherits the
+            # Assume the ``SampleSheet.Read_Structure`` inherits the
             # ``sample.Read_Structure`` only if ``SampleSheet.Read_Structure``
             # has not already been defined. If ``SampleSheet.reads`` has been
             # defined then validate the new read_structure against it.
-            if (
-                self.is_paired_end
-                and not sample.Read_Structure.is_paired_end
-                or self.is_single_end  # noqa
-                and not sample.Read_Structure.is_single_end
-            ):
-                raise ValueError(
-                    f'Sample sheet pairing has been set with '
-                    f'Reads:"{self.Reads}" and is not compatible with sample '
-                    f'read structure: {sample.Read_Structure}'
-                )
+            if read_structure is not None and self.Read_Structure is None:
+                if (
+                    self.is_paired_end
+                    and not read_structure.is_paired_end
+                    or self.is_single_end  # noqa
+                    and not read_structure.is_single_end
+                ):
+                    raise ValueError(
+                        f'Sample sheet pairing has been set with '
+                        f'Reads:"{self.Reads}" and is not compatible with '
+                        f'sample read structure: {read_structure}'
+                    )
 
-            # Make a copy of this samples read_structure for the sample sheet.
-            self.Read_Structure = sample.Read_Structure.copy()
+                # Read structures are immutable so the sample's can be shared.
+                self.Read_Structure = read_structure
 
         # Validate this sample against the ``SampleSheet.Read_Structure``
-        # attribute, which can be None, to ensure they are the same.
-        if self.Read_Structure != sample.Read_Structure:
+        # attribute, which can be None, to ensure they are the same. Samples
+        # usually share one instance so check identity before equality.
+        sheet_read_structure = self.Read_Structure
+        if (
+            read_structure is not sheet_read_structure
+            and sheet_read_structure != read_structure
+        ):
             raise ValueError(
-                f'Sample read structure ({sample.Read_Structure}) different '
-                f'than read structure in samplesheet ({self.Read_Structure}).'
+                f'Sample read structure ({read_structure}) different '
+                f'than read structure in samplesheet '
+                f'({sheet_read_structure}).'
             )
 
         # Compare this sample against all those already defined to ensure none
         # have equal ``Sample_ID``, ``Library_ID``, and ``Lane`` attributes.
+        # Samples already added are indexed by these attributes so the check
+        # is a hash lookup instead of a scan over every previous sample.
+        sample_key = sample._identity()
+        if sample_key in self._sample_keys:
+            other = self._sample_keys[sample_key]
+            message = (
+                f'Two equivalent samples added:'
+                f'\n\n1): {sample.__repr__()}\n2): {other.__repr__()}\n'
+            )
+            # TODO: Look into if this is truly illegal or not.
+            warnings.warn(UserWarning(message))
+
         # Ensure that all samples have attributes ``index``, ``index2``, or
-        # both if they have been defined.
-        for other in self.samples:
-            if sample == other:
-                message = (
-                    f'Two equivalent samples added:'
-                    f'\n\n1): {sample.__repr__()}\n2): {other.__repr__()}\n'
-                )
-                # TODO: Look into if this is truly illegal or not.
-                warnings.warn(UserWarning(message))
-            if sample.index is None and self.samples_have_index:
-                raise ValueError(
-                    f'Cannot add a sample without attribute `index` if a '
-                    f'previous sample has `index` set: {sample})'
-                )
-            if sample.index2 is None and self.samples_have_index2:
-                raise ValueError(
-                    f'Cannot add a sample without attribute `index2` if a '
-                    f'previous sample has `index2` set: {sample})'
-                )
+        # both if they have been defined. The index design is fixed by the
+        # first sample added to the sample sheet.
+        have_index, have_index2 = (
+            self.samples_have_index,
+            self.samples_have_index2,
+        )
+        if index is None and have_index:
+            raise ValueError(
+                f'Cannot add a sample without attribute `index` if a '
+                f'previous sample has `index` set: {sample})'
+            )
+        if index2 is None and have_index2:
+            raise ValueError(
+                f'Cannot add a sample without attribute `index2` if a '
+                f'previous sample has `index2` set: {sample})'
+            )
 
-            # Prevent index collisions when samples are dual-indexed
-            if (
-                self.samples_have_index
-                and self.samples_have_index2
-                and sample.index == other.index
-                and sample.index2 == other.index2
-                and sample.Lane == other.Lane
-            ):
+        # Prevent index collisions per lane, or per flowcell if no lanes are
+        # defined. Only the indexes the samples are designed with are keyed.
+        index_key = self._index_key(sample)
+        if index_key is not None:
+            collision = self._index_keys.get(index_key)
+            if collision is not None and have_index and have_index2:
                 raise ValueError(
                     f'Sample index combination for {sample} has already been '
-                    f'added on this lane or flowcell: {other}'
+                    f'added on this lane or flowcell: {collision}'
                 )
-
-            # Prevent index collisions when samples are single-indexed (index)
-            if (
-                self.samples_have_index
-                and not self.samples_have_index2
-                and sample.index == other.index
-                and sample.Lane == other.Lane
-            ):
+            elif collision is not None and have_index:
                 raise ValueError(
                     f'First sample index for {sample} has already been '
-                    f'added on this lane or flowcell: {other}'
+                    f'added on this lane or flowcell: {collision}'
                 )
-
-            # Prevent index collisions when samples are single-indexed (index2)
-            if (
-                not self.samples_have_index
-                and self.samples_have_index2
-                and sample.index2 == other.index2
-                and sample.Lane == other.Lane
-            ):
+            elif collision is not None:
                 raise ValueError(
                     f'Second sample index for {sample} has already been '
-                    f'added on this lane or flowcell: {other}'
+                    f'added on this lane or flowcell: {collision}'
                 )
+            self._index_keys[index_key] = sample
+
+        self._sample_keys.setdefault(sample_key, sample)
 
         sample.sample_sheet = self
         self._samples.append(sample)
 
+    def _index_key(self, sample: Sample) -> Optional[Tuple]:
+        """Return the key which detects index collisions for a sample.
+
+        Only the indexes the samples are designed with are keyed, along with
+        the lane. If the samples have no indexes then ``None`` is returned.
+
+        """
+        have_index, have_index2 = (
+            self.samples_have_index,
+            self.samples_have_index2,
+        )
+        if not (have_index or have_index2):
+            return None
+        get = sample.get
+        return (
+            get('index') if have_index else None,
+            get('index2') if have_index2 else None,
+            get('Lane'),
+        )
+
+    def _reindex_samples(self) -> None:
+        """Rebuild the hash indexes from the current values of all samples."""
+        self._sample_keys = {}
+        self._index_keys = {}
+        for sample in self._samples:
+            self._sample_keys.setdefault(sample._identity(), sample)
+            index_key = self._index_key(sample)
+            if index_key is not None:
+                self._index_keys.setdefault(index_key, sample)
+
     def add_samples(self, samples: Iterable[Sample]) -> None:
         """Add samples in an iterable to this :class:`SampleSheet`."""
+        self._reindex_samples()
         for sample in samples:
-            self.add_sample(sample)
+            self._add_sample(sample)
 
     def to_json(self, **kwargs: Mapping) -> str:
         """Write this :class:`SampleSheet` to JSON.
@@ -756,12 +1012,23 @@ class SampleSheet(object):
             and all(isinstance(lane, int) for lane in lanes)
         ):
             raise ValueError(f'Lanes must be an int or list of ints: {lanes}')
-        if len(set(len(sample.index or '') for sample in self.samples)) != 1:
-            raise ValueError('I7 indexes have differing lengths.')
-        if len(set(len(sample.index2 or '') for sample in self.samples)) != 1:
+
+        # Check both index lengths in one pass. A differing I7 length stops
+        # the scan, but I7 is reported before I5 so I5 waits for the end.
+        samples = self.samples
+        i7_length = len(samples[0].get('index') or '')
+        i5_length = len(samples[0].get('index2') or '')
+        i5_differs = False
+        for sample in samples:
+            if len(sample.get('index') or '') != i7_length:
+                raise ValueError('I7 indexes have differing lengths.')
+            if len(sample.get('index2') or '') != i5_length:
+                i5_differs = True
+        if i5_differs:
             raise ValueError('I5 indexes have differing lengths.')
+
         for attr in ('Sample_Name', 'Library_ID', 'index'):
-            if any(getattr(sample, attr) is None for sample in self.samples):
+            if any(getattr(sample, attr) is None for sample in samples):
                 raise ValueError(
                     'Samples must have at least `Sample_Name`, '
                     '`Sample_Library`, and `index` attributes'
@@ -774,8 +1041,9 @@ class SampleSheet(object):
         prefix = Path(directory).expanduser().resolve()
         prefix.mkdir(exist_ok=True, parents=True)
 
-        # Promote bam_prefix to Path object.
-        bam_prefix = Path(bam_prefix).expanduser().resolve()
+        # Resolve bam_prefix once and keep it as a string since BAM paths are
+        # only ever joined onto it and written out as text.
+        bam_root = os.fspath(Path(bam_prefix).expanduser().resolve())
 
         # Both headers are one column larger if an ``index2`` attribute is
         # present on all samples. Use list splatting to unpack the options.
@@ -801,123 +1069,136 @@ class SampleSheet(object):
             'DS',
         ]
 
-        for lane in lanes:
-            barcode_out = prefix / f'barcode_params.{lane}.txt'
-            library_out = prefix / f'library_params.{lane}.txt'
+        has_index2 = self.samples_have_index2
+        unmatched_indexes = ('N', 'N') if has_index2 else ('N',)
 
-            # Enter into a writing context for both library and barcode params.
-            with ExitStack() as stack:
-                barcode_writer = csv.writer(
-                    stack.enter_context(barcode_out.open('w')), delimiter='\t'
-                )
-                library_writer = csv.writer(
-                    stack.enter_context(library_out.open('w')), delimiter='\t'
+        for lane in lanes:
+            barcode_lines: List[str] = [_format_row(barcode_header, '\t')]
+            library_lines: List[str] = [_format_row(library_header, '\t')]
+            add_barcode_line = barcode_lines.append
+            add_library_line = library_lines.append
+
+            for sample in samples:
+                # Read each value once with ``Sample.get()``, which skips the
+                # failed attribute lookup behind every ``getattr()`` call.
+                get = sample.get
+                name, library = get('Sample_Name'), get('Library_ID')
+                index, index2 = get('index'), get('index2')
+                description = get('Description')
+
+                # The long name of a sample is a combination of the sample
+                # ID and the sample library.
+                long_name = '.'.join([name, library])
+
+                # The barcode name is all sample indexes concatenated.
+                barcode_name = index + (index2 or '')
+
+                # Assemble the path to the future BAM file.
+                bam_file = os.path.join(
+                    bam_root, long_name, f'{name}.{barcode_name}.{lane}.bam'
                 )
 
-                barcode_writer.writerow(barcode_header)
-                library_writer.writerow(library_header)
-
-                for sample in self.samples:
-                    # The long name of a sample is a combination of the sample
-                    # ID and the sample library.
-                    long_name = '.'.join(
-                        [sample.Sample_Name, sample.Library_ID]
-                    )
-
-                    # The barcode name is all sample indexes concatenated.
-                    barcode_name = sample.index + (sample.index2 or '')
-                    library_name = sample.Library_ID or ''
-
-                    # Assemble the path to the future BAM file.
-                    bam_file = (
-                        bam_prefix
-                        / long_name
-                        / f'{sample.Sample_Name}.{barcode_name}.{lane}.bam'
-                    )
-
-                    # Use list splatting to build the contents of the library
-                    # and barcodes parameter files.
-                    barcode_line = [
-                        *(
-                            [sample.index]
-                            if not self.samples_have_index2
-                            else [sample.index, sample.index2]
-                        ),
-                        barcode_name,
-                        library_name,
-                    ]
-
-                    library_line = [
-                        *(
-                            [sample.index]
-                            if not self.samples_have_index2
-                            else [sample.index, sample.index2]
-                        ),
-                        bam_file,
-                        sample.Sample_Name,
-                        sample.Library_ID,
-                        sample.Description or '',
-                    ]
-
-                    barcode_writer.writerow(map(str, barcode_line))
-                    library_writer.writerow(map(str, library_line))
-
-                # Dempultiplexing relys on an umatched file so append that,
-                # but only to the library parameters file.
-                unmatched_file = bam_prefix / f'unmatched.{lane}.bam'
+                # Use list splatting to build the contents of the library
+                # and barcodes parameter files.
+                indexes = (index, index2) if has_index2 else (index,)
+                barcode_line = [*indexes, barcode_name, library or '']
                 library_line = [
-                    *(['N'] if not self.samples_have_index2 else ['N', 'N']),
-                    unmatched_file,
-                    'unmatched',
-                    'unmatchedunmatched',
-                    '',
+                    *indexes,
+                    bam_file,
+                    name,
+                    library,
+                    str(description or ''),
                 ]
-                library_writer.writerow(map(str, library_line))
+
+                add_barcode_line(_format_row(barcode_line, '\t'))
+                add_library_line(_format_row(library_line, '\t'))
+
+            # Dempultiplexing relys on an umatched file so append that, but
+            # only to the library parameters file.
+            unmatched_file = os.path.join(bam_root, f'unmatched.{lane}.bam')
+            library_line = [
+                *unmatched_indexes,
+                unmatched_file,
+                'unmatched',
+                'unmatchedunmatched',
+                '',
+            ]
+            library_lines.append(_format_row(library_line, '\t'))
+
+            # Each file is rendered in memory and written as encoded bytes in
+            # one call, skipping the text layer entirely.
+            barcode_out = prefix / f'barcode_params.{lane}.txt'
+            library_out = prefix / f'library_params.{lane}.txt'
+            barcode_out.write_bytes(''.join(barcode_lines).encode())
+            library_out.write_bytes(''.join(library_lines).encode())
 
     def write(self, handle: TextIO, blank_lines: int = 1) -> None:
         """Write this :class:`SampleSheet` to a file-like object.
 
         Args:
-            handle: Object to wrap by csv.writer.
+            handle: File-like object to write the sample sheet to.
             blank_lines: Number of blank lines to write between sections.
 
         """
         if not isinstance(blank_lines, int) or blank_lines <= 0:
             raise ValueError('Number of blank lines must be a positive int.')
 
-        writer = csv.writer(handle)
-        csv_width: int = max([len(self.all_sample_keys), 2])
-
-        section_order = ['Header', 'Reads'] + self._sections + ['Settings']
+        # Render the sample sheet in memory so ``handle`` receives one write.
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        samples = self.samples
+        sample_keys = tuple(self.all_sample_keys)
+        csv_width: int = max([len(sample_keys), 2])
 
-        def pad_iterable(
-            iterable: Iterable, size: int = csv_width, padding: str = ''
-        ) -> List[str]:
-            return list(islice(chain(iterable, repeat(padding)), size))
-
-        def write_blank_lines(
-            writer: Any, n: int = blank_lines, width: int = csv_width
-        ) -> None:
-            for i in range(n):
-                writer.writerow(pad_iterable([], width))
-
-        for title in section_order:
-            writer.writerow(pad_iterable([f'[{title}]'], csv_width))
-            section = getattr(self, title)
-            if title == 'Reads':
-                for read in self.Reads:
-                    writer.writerow(pad_iterable([read], csv_width))
-            else:
-                for key, value in section.items():
-                    writer.writerow(pad_iterable([key, value], csv_width))
-            write_blank_lines(writer)
+        # Padding for a row of every possible length, indexed by row length.
+        pad_tails = [
+            [''] * (csv_width - size) for size in range(csv_width + 1)
+        ]
+        title_tail, pair_tail = pad_tails[1], pad_tails[2]
+        data_tail = pad_tails[len(sample_keys)]
+
+        # Rows for all sections in write order. [Reads] is the only section
+        # that is not made of key:value pairs so it is built on its own.
+        sections: List[Tuple[str, List[List[Any]]]] = []
+        for title in ['Header'] + self._sections + ['Settings']:
+            items = getattr(self, title).items()
+            rows = [[key, value, *pair_tail] for key, value in items]
+            sections.append((title, rows))
+        sections.insert(
+            1, ('Reads', [[read, *title_tail] for read in self.Reads])
+        )
 
-        writer.writerow(pad_iterable(['[Data]'], csv_width))
-        writer.writerow(pad_iterable(self.all_sample_keys, csv_width))
+        # Every row up to and including the [Data] header goes to the writer
+        # in one batch.
+        blank_rows = [pad_tails[0]] * blank_lines
+        all_rows: List[List[Any]] = []
+        for title, rows in sections:
+            all_rows.append([f'[{title}]', *title_tail])
+            all_rows.extend(rows)
+            all_rows.extend(blank_rows)
+        all_rows.append(['[Data]', *title_tail])
+        all_rows.append([*sample_keys, *data_tail])
+        writer.writerows(all_rows)
+
+        # Gather sample values a column at a time with ``Sample.get()`` which
+        # skips the failed attribute lookup behind every ``getattr()`` call,
+        # then pivot the columns into rows.
+        columns = [
+            list(map(methodcaller('get', key), samples)) for key in sample_keys
+        ]
 
-        for sample in self.samples:
-            line = [getattr(sample, key) for key in self.all_sample_keys]
-            writer.writerow(pad_iterable(line, csv_width))
+        # Sample rows are joined directly as the csv module would write them,
+        # where ``None`` becomes an empty field and other values are cast.
+        buffer.write(
+            ''.join(
+                _format_row(
+                    ['' if value is None else str(value) for value in row]
+                    + data_tail
+                )
+                for row in zip(*columns)
+            )
+        )
+        handle.write(buffer.getvalue())
 
     def __len__(self) -> int:
         """Return the number of samples on this :class:`SampleSheet`."""
@@ -940,10 +1221,8 @@ class SampleSheet(object):
         then return the invocable representation of this instance.
 
         """
-        try:
-            in_terminal = os.isatty(sys.stdout.fileno())
-        except OSError:  # pragma: no cover
-            in_terminal = False
+        # Replaced streams (e.g. captured output) may not have ``isatty()``.
+        in_terminal = hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()
 
         if in_terminal:  # pragma: no cover
             return self._repr_tty_()
@@ -952,6 +1231,8 @@ class SampleSheet(object):
 
     def _repr_tty_(self) -> str:
         """Return a summary of this sample sheet in a TTY compatible codec."""
+        from terminaltables import SingleTable
+
         header_description = ['Sample_ID', 'Description']
         header_samples = [
             'Sample_ID',
@@ -961,43 +1242,42 @@ class SampleSheet(object):
             'index2',
         ]
 
-        header = SingleTable([], 'Header')
-        setting = SingleTable([], 'Settings')
-        sample_main = SingleTable([header_samples], 'Identifiers')
         sample_desc = SingleTable([header_description], 'Descriptions')
 
+        # Descriptions are wrapped to the allowable space remaining. The table
+        # only holds its header row here so the width is measured once.
+        description_width = max(MIN_WIDTH, sample_desc.column_max_width(-1))
+
         # All key:value pairs found in the [Header] section.
-        max_header_width = max(MIN_WIDTH, sample_desc.column_max_width(-1))
-        for key in self.Header.keys():
-            if 'Description' in key:
-                value = '\n'.join(
-                    wrap(getattr(self.Header, key), max_header_width)
-                )
-            else:
-                value = getattr(self.Header, key)
-            header.table_data.append([key, value])
+        header_rows = []
+        for key, value in self.Header.items():
+            if value and 'Description' in key:
+                value = _wrap(value, description_width)
+            header_rows.append([key, value])
 
         # All key:value pairs found in the [Settings] and [Reads] sections.
-        for key in self.Settings.keys():
-            setting.table_data.append((key, getattr(self.Settings, key) or ''))
-        setting.table_data.append(('Reads', ', '.join(map(str, self.Reads))))
+        setting_rows = [
+            (key, value or '') for key, value in self.Settings.items()
+        ]
+        setting_rows.append(('Reads', ', '.join(map(str, self.Reads))))
 
-        # Descriptions are wrapped to the allowable space remaining.
-        description_width = max(MIN_WIDTH, sample_desc.column_max_width(-1))
+        # Collect all sample rows and hand them to the tables in one go.
+        main_rows: List[Any] = [header_samples]
+        desc_rows: List[Any] = [header_description]
         for sample in self.samples:
             # Add all key:value pairs for this sample
-            sample_main.table_data.append(
-                [getattr(sample, title) or '' for title in header_samples]
-            )
-            # Wrap and add the sample descrption
-            sample_desc.table_data.append(
-                (
-                    sample.Sample_ID,
-                    '\n'.join(
-                        wrap(sample.Description or '', description_width)
-                    ),
-                )
-            )
+            get = sample.get
+            main_rows.append([get(title) or '' for title in header_samples])
+            # Wrap and add the sample descrption, most samples have none.
+            description = get('Description') or ''
+            if description:
+                description = _wrap(description, description_width)
+            desc_rows.append((get('Sample_ID'), description))
+
+        header = SingleTable(header_rows, 'Header')
+        setting = SingleTable(setting_rows, 'Settings')
+        sample_main = SingleTable(main_rows, 'Identifiers')
+        sample_desc.table_data = desc_rows
 
         # These tables do not have horizontal headers so remove the frame.
         header.inner_heading_row_border = False
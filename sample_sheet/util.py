@@ -1,7 +1,104 @@
 # pylint: disable=E0401
-from typing import Any
+from collections import abc
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
-__all__ = ['is_ipython_interpreter', 'maybe_render_markdown']
+__all__ = [
+    'CaseInsensitiveDict',
+    'is_ipython_interpreter',
+    'maybe_render_markdown',
+    'open_path',
+]
+
+
+class _CaseInsensitiveItemsView(abc.ItemsView):
+    """Items view which pairs the stored keys and values without lookups."""
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        mapping = self._mapping  # type: ignore[attr-defined]
+        return zip(mapping._keys.values(), mapping._store.values())
+
+
+class CaseInsensitiveDict(MutableMapping[str, Any]):
+    """A case-insensitive ``dict``-like object.
+
+    Values are stored in a plain ``dict`` under lowercased keys and the case
+    of the most recently set key is remembered for iteration. Missing keys are
+    returned by :meth:`get` without raising and catching a ``KeyError``.
+
+    Examples:
+        >>> mapping = CaseInsensitiveDict({'Sample_ID': '87'})
+        >>> mapping['sample_id']
+        '87'
+        >>> list(mapping)
+        ['Sample_ID']
+
+    """
+
+    __slots__ = ('_store', '_keys')
+
+    def __init__(self, data: Optional[Mapping] = None, **kwargs: Any) -> None:
+        self._store: Dict[str, Any] = {}
+        self._keys: Dict[str, str] = {}
+        self.update(data or {}, **kwargs)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        lower = key.lower()
+        self._store[lower] = value
+        self._keys[lower] = key
+
+    def __getitem__(self, key: str) -> Any:
+        return self._store[key.lower()]
+
+    def __delitem__(self, key: str) -> None:
+        lower = key.lower()
+        del self._store[lower]
+        del self._keys[lower]
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and key.lower() in self._store
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys.values())
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for a key if it exists, else ``default``."""
+        return self._store.get(key.lower(), default)
+
+    def items(self) -> abc.ItemsView:  # type: ignore[override]
+        """Return a view of all items with keys in their original case."""
+        return _CaseInsensitiveItemsView(self)
+
+    def lower_items(self) -> Iterable[Tuple[str, Any]]:
+        """Like :meth:`items`, but with all lowercase keys."""
+        return self._store.items()
+
+    def copy(self) -> 'CaseInsensitiveDict':
+        """Return a shallow copy of this mapping."""
+        return CaseInsensitiveDict(dict(self.items()))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, abc.Mapping):
+            return NotImplemented
+        other = CaseInsensitiveDict(other)
+        return dict(self.lower_items()) == dict(other.lower_items())
+
+    def __repr__(self) -> str:
+        return str(dict(self.items()))
 
 
 def is_ipython_interpreter() -> bool:  # pragma: no cover
@@ -19,3 +116,24 @@ def maybe_render_markdown(string: str) -> Any:
         return Markdown(string)
     else:
         return string
+
+
+def open_path(path: Union[Path, str]) -> TextIO:
+    """Open a path for reading in text mode.
+
+    Paths are opened with ``smart_open`` if it is installed, otherwise with
+    the builtin :func:`open`. ``smart_open`` is imported when a path is opened
+    instead of when this package is imported.
+
+    """
+    try:  # pragma: no cover
+        # This import works for smart_open>=1.8.1
+        from smart_open import open as smart_open
+    except ImportError:  # pragma: no cover
+        try:
+            # This import works for smart_open<1.8.1
+            from smart_open import smart_open
+        except ImportError:
+            return open(path, 'r')
+
+    return smart_open(str(path), 'r')  # type: ignore
@@ -26,7 +26,7 @@ setuptools.setup(
     license='MIT',
     zip_safe=True,
     packages=setuptools.find_packages(),
-    install_requires=['click', 'requests', 'tabulate', 'terminaltables'],
+    install_requires=['click', 'tabulate', 'terminaltables'],
     extras_require={'smart_open': ['smart_open>=1.5.4']},
     scripts=['scripts/sample-sheet'],
     keywords='illumina samplesheet sample sheet parser bioinformatics',
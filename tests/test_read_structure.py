@@ -1,7 +1,7 @@
 import pytest
 
 from nose.tools import assert_false
-from nose.tools import assert_not_equal
+from nose.tools import assert_is
 from nose.tools import assert_raises
 from nose.tools import assert_true
 from nose.tools import eq_
@@ -96,10 +96,17 @@ class TestReadStructure(TestCase):
         )
 
     def test_copy(self):
-        """Test a shallow copy with ``copy()``"""
+        """Test ``copy()`` shares the immutable read structure"""
         read_structure1 = ReadStructure('115T')
         read_structure2 = read_structure1.copy()
-        assert_not_equal(id(read_structure1), id(read_structure2))
+        assert_is(read_structure1, read_structure2)
+
+    def test_structure_is_read_only(self):
+        """Test ``structure`` cannot be reassigned on a shared instance"""
+        read_structure = ReadStructure('151T8B151T')
+        with assert_raises(AttributeError):
+            read_structure.structure = '10T'
+        eq_(read_structure.structure, '151T8B151T')
 
     def test_equal(self):
         """Test ``ReadStructure.__eq__()``"""
@@ -117,3 +124,10 @@ class TestReadStructure(TestCase):
     def test_str(self):
         """Test ``ReadStructure.__str__()`` after initialization"""
         eq_(str(ReadStructure('51T')), '51T')
+
+    def test_regex_validation_of_partial_structures(self):
+        """Test structures with leading, trailing, or no valid tokens"""
+        assert_raises(ValueError, ReadStructure, '')
+        assert_raises(ValueError, ReadStructure, 'T151T')
+        assert_raises(ValueError, ReadStructure, '151T8')
+        assert_raises(ValueError, ReadStructure, '151T 8B')
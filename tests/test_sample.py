@@ -1,6 +1,7 @@
 import pytest
 
 from nose.tools import assert_dict_equal
+from nose.tools import assert_is
 from nose.tools import assert_is_instance
 from nose.tools import assert_is_none
 from nose.tools import assert_list_equal
@@ -107,3 +108,55 @@ class TestSample(TestCase):
                 '\'Sample_Name\': None, \'index\': None})'
             ),
         )
+
+    def test_read_structure_is_shared(self):
+        """Test that samples with equal read structures share an instance."""
+        sample1 = Sample({'Read_Structure': '151T8B151T', 'index': 'ACGT'})
+        sample2 = Sample({'Read_Structure': '151T8B151T', 'index': 'TGCA'})
+        assert_is(sample1.Read_Structure, sample2.Read_Structure)
+
+    def test_eq_after_mutation(self):
+        """Test equality is updated when an identifying key is changed."""
+        fake1 = Sample({'Sample_ID': 1, 'Library_ID': '10x', 'Lane': '1'})
+        fake2 = Sample({'Sample_ID': 1, 'Library_ID': '10x', 'Lane': '2'})
+
+        assert_not_equal(fake1, fake2)
+        fake2['Lane'] = '1'
+        eq_(fake1, fake2)
+        del fake2['Lane']
+        assert_not_equal(fake1, fake2)
+
+    def test_to_json_after_mutation(self):
+        """Test ``to_json()`` is updated when a key is changed."""
+        sample = Sample({'Sample_ID': 1, 'Lane': 2})
+        eq_(sample.to_json(), {'Sample_ID': '1', 'Lane': '2'})
+
+        sample.to_json()['Lane'] = '3'
+        eq_(sample.to_json(), {'Sample_ID': '1', 'Lane': '2'})
+
+        sample['Lane'] = 3
+        eq_(sample.to_json(), {'Sample_ID': '1', 'Lane': '3'})
+        del sample['Lane']
+        eq_(sample.to_json(), {'Sample_ID': '1'})
+
+    def test_row_factory(self):
+        """Test building samples from rows is equivalent to ``Sample()``."""
+        header = ['Sample_ID', 'index', 'Read_Structure', 'Description']
+        row = ['1', 'ACGT', '151T8B151T', 'A description']
+        sample = Sample._row_factory(header)(row)
+        assert_dict_equal(dict(sample), dict(Sample(dict(zip(header, row)))))
+        assert_is_instance(sample.Read_Structure, ReadStructure)
+        eq_(sample.read_structure, ReadStructure('151T8B151T'))
+        assert_raises(ValueError, Sample._row_factory(header), ['1', 'ACUG'])
+        assert_raises(
+            ValueError,
+            Sample._row_factory(['Sample_ID', 'Read_Structure']),
+            ['1', '151T8B151T'],
+        )
+
+    def test_promotion_of_read_structure_spellings(self):
+        """Test that any spelling of Read_Structure is promoted."""
+        for key in ('Read_Structure', 'readstructure', 'READ__STRUCTURE'):
+            sample = Sample({key: '151T'})
+            assert_is_instance(sample[key], ReadStructure)
+        eq_(Sample({'Read_Structures': '151T'}).Read_Structures, '151T')
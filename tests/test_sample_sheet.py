@@ -1,4 +1,5 @@
 import pytest
+import warnings
 
 from nose.tools import assert_false
 from nose.tools import assert_is_instance
@@ -263,6 +264,88 @@ class TestSampleSheet(TestCase):
 
         assert_raises(ValueError, sample_sheet.add_sample, sample2)
 
+    def test_add_sample_after_index_changed(self):
+        """Test ``add_sample()`` checks indexes changed after being added."""
+        sample1 = Sample({'Sample_ID': 49, 'index': 'ACGT'})
+        sample_sheet = SampleSheet()
+        sample_sheet.add_sample(sample1)
+        sample1['index'] = 'TTTT'
+
+        sample_sheet.add_sample(Sample({'Sample_ID': 23, 'index': 'ACGT'}))
+        assert_raises(
+            ValueError,
+            sample_sheet.add_sample,
+            Sample({'Sample_ID': 12, 'index': 'TTTT'}),
+        )
+
+    def test_add_sample_after_sample_removed(self):
+        """Test ``add_sample()`` after a sample is removed from ``samples``."""
+        sample1 = Sample({'Sample_ID': 49, 'index': 'ACGT'})
+        sample_sheet = SampleSheet()
+        sample_sheet.add_sample(sample1)
+        sample_sheet.samples.remove(sample1)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            sample_sheet.add_sample(Sample({'Sample_ID': 49, 'index': 'ACGT'}))
+        eq_(len(sample_sheet.samples), 1)
+
+    def test_add_sample_after_sample_replaced(self):
+        """Test ``add_sample()`` after a sample is replaced in ``samples``."""
+        sample_sheet = SampleSheet()
+        sample_sheet.add_sample(Sample({'Sample_ID': 49, 'index': 'ACGT'}))
+        sample_sheet.samples[0] = Sample({'Sample_ID': 49, 'index': 'TTTT'})
+
+        assert_raises(
+            ValueError,
+            sample_sheet.add_sample,
+            Sample({'Sample_ID': 23, 'index': 'TTTT'}),
+        )
+
+    def test_add_sample_after_appended_sample_changed(self):
+        """Test ``add_sample()`` checks samples appended to ``samples``."""
+        sample1 = Sample({'Sample_ID': 49, 'index': 'ACGT'})
+        sample2 = Sample({'Sample_ID': 23, 'index': 'GGGG'})
+        sample_sheet = SampleSheet()
+        sample_sheet.add_sample(sample1)
+        sample_sheet.samples.append(sample2)
+        sample_sheet.add_sample(Sample({'Sample_ID': 12, 'index': 'CCCC'}))
+        sample2['index'] = 'TTTT'
+
+        assert_raises(
+            ValueError,
+            sample_sheet.add_sample,
+            Sample({'Sample_ID': 6, 'index': 'TTTT'}),
+        )
+
+    def test_add_sample_shared_between_sheets(self):
+        """Test ``add_sample()`` checks a sample added to two sheets."""
+        sample1 = Sample({'Sample_ID': 49, 'index': 'ACGT'})
+        sample_sheet1, sample_sheet2 = SampleSheet(), SampleSheet()
+        sample_sheet1.add_sample(sample1)
+        sample_sheet2.add_sample(sample1)
+        sample1['index'] = 'TTTT'
+
+        for sample_sheet in (sample_sheet1, sample_sheet2):
+            assert_raises(
+                ValueError,
+                sample_sheet.add_sample,
+                Sample({'Sample_ID': 23, 'index': 'TTTT'}),
+            )
+
+    def test_add_samples_checks_current_samples(self):
+        """Test ``add_samples()`` checks samples changed after being added."""
+        sample1 = Sample({'Sample_ID': 49, 'index': 'ACGT'})
+        sample_sheet = SampleSheet()
+        sample_sheet.add_samples([sample1])
+        sample1['index'] = 'TTTT'
+
+        assert_raises(
+            ValueError,
+            sample_sheet.add_samples,
+            [Sample({'Sample_ID': 23, 'index': 'TTTT'})],
+        )
+
     def test_add_sample_with_missing_index(self):
         """Test ``add_sample()`` when a sample has a missing index."""
         sample1 = Sample({'Sample_ID': 49, 'index': 'ACGTAC'})
@@ -325,6 +408,23 @@ class TestSampleSheet(TestCase):
 
         assert_raises(ValueError, SampleSheet, filename)
 
+    def test_parse_short_data_row(self):
+        """Test a data row shorter than the header only holds its keys"""
+        filename = string_as_temporary_file(
+            '[Header]\n'
+            '[Settings]\n'
+            '[Reads]\n'
+            '[Data]\n'
+            'Sample_ID,Sample_Name,index,Description\n'
+            'S1,N1,ACGT\n'
+        )
+        sample = SampleSheet(filename).samples[0]
+        eq_(list(sample), ['Sample_ID', 'Sample_Name', 'index'])
+        eq_(
+            dict(sample),
+            {'Sample_ID': 'S1', 'Sample_Name': 'N1', 'index': 'ACGT'},
+        )
+
     def test_parse_limited_commas(self):
         """Test minimium required commas"""
         filename = string_as_temporary_file(
@@ -556,6 +656,20 @@ class TestSampleSheet(TestCase):
         eq_(sample_sheet.Manifests.PoolRNA, 'RNAMatrix.txt')
         eq_(sample_sheet.Manifests.PoolDNA, 'DNAMatrix.txt')
 
+    def test_add_section_twice(self):
+        """Test ``add_section()`` registers a section name only once"""
+        sample_sheet = SampleSheet()
+        sample_sheet.add_section('Pool Manifests')
+        sample_sheet.Pool_Manifests['PoolRNA'] = 'RNAMatrix.txt'
+        sample_sheet.add_section('Pool Manifests')
+
+        eq_(sample_sheet.Pool_Manifests.PoolRNA, 'RNAMatrix.txt')
+
+        string_handle = StringIO(newline=None)
+        sample_sheet.write(string_handle)
+        string_handle.seek(0)
+        eq_(string_handle.read().count('[Pool_Manifests]'), 1)
+
     def test_to_json(self):
         """Test ``SampleSheet.to_json()`` all output"""
         sample_sheet = SampleSheet()
@@ -697,6 +811,33 @@ class TestSampleSheet(TestCase):
             sample_sheet1.all_sample_keys, sample_sheet2.all_sample_keys
         )
 
+    def test_write_single_sample_key(self):
+        """Test ``write()`` when samples only have a ``Sample_ID``"""
+        sample_sheet = SampleSheet()
+        sample_sheet.add_sample(Sample({'Sample_ID': 'sample1'}))
+
+        string_handle = StringIO(newline=None)
+        sample_sheet.write(string_handle)
+        string_handle.seek(0)
+
+        lines = string_handle.read().splitlines()
+        assert_list_equal(lines[-3:], ['[Data],', 'Sample_ID,', 'sample1,'])
+
+    def test_write_quoted_sample_values(self):
+        """Test ``write()`` when sample values require quoting"""
+        sample_sheet1 = SampleSheet()
+        sample_sheet1.add_sample(
+            Sample({'Sample_ID': 'sample1', 'Description': 'A, "B"'})
+        )
+
+        string_handle = StringIO(newline=None)
+        sample_sheet1.write(string_handle)
+        string_handle.seek(0)
+        filename = string_as_temporary_file(string_handle.read())
+
+        sample_sheet2 = SampleSheet(filename)
+        eq_(sample_sheet2.samples[0].Description, 'A, "B"')
+
     def test_write_invalid_num_blank_lines(self):
         """Test ``write()`` when given invalid number of blank lines"""
         infile = RESOURCES / 'paired-end-single-index.csv'
@@ -18,3 +18,23 @@ class TestSection(TestCase):
         section = Section()
         section['PoolRNA'] = 'temporary'
         assert section.PoolRNA == 'temporary'
+
+    def test_case_insensitive_keys(self):
+        """Test keys are case insensitive but keep their last set case"""
+        section = Section({'PoolRNA': 'temporary'})
+        assert section['poolrna'] == 'temporary'
+        assert 'POOLRNA' in section
+        section['poolRNA'] = 'updated'
+        assert list(section.items()) == [('poolRNA', 'updated')]
+        assert section == {'POOLRNA': 'updated'}
+        del section['PoolRNA']
+        assert len(section) == 0
+
+    def test_items_keep_insertion_order(self):
+        """Test items pair keys and values in insertion order"""
+        section = Section({'PoolRNA': 'temporary', 'Date': 'today'})
+        section['date'] = 'tomorrow'
+        del section['poolrna']
+        section['Lane'] = 1
+        assert list(section.items()) == [('date', 'tomorrow'), ('Lane', 1)]
+        assert ('Lane', 1) in section.items()